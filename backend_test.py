@@ -3,44 +3,187 @@ Comprehensive Backend API Testing for One-Stop Career & Education Advisor
 Tests all backend endpoints including quiz system, user management, gamification, and roadmaps
 """
 
-import requests
-import json
-import uuid
-from typing import Dict, List, Any
-import time
+import asyncio
+import collections
+import functools
+import sys
+import httpx
+import msgspec
+import orjson
+import random
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Any, Tuple
 BACKEND_URL = "https://careerquest-app.preview.emergentagent.com/api"
+_RNG = random.Random()
+RETRY_TOTAL = 2
+RETRY_BACKOFF = 0.2
+RETRY_STATUSES = frozenset({502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+_UID_PLACEHOLDER = b'"__UID__"'
+
+# Quiz categories answered correctly for each answering strategy
+STRATEGY_TARGETS = {
+    "problem_solving_creativity": frozenset({"problem_solving", "creativity"}),
+    "analytics_high": frozenset({"analytics", "problem_solving"}),
+    "leadership_communication": frozenset({"leadership", "communication"}),
+    "default": frozenset()
+}
+
+EXPECTED_CATEGORIES = frozenset({"problem_solving", "creativity", "leadership", "analytics", "communication"})
+EXPECTED_ROLES = ("Web Developer", "Flutter Developer", "Data Scientist", "Cybersecurity Specialist", "Entrepreneur")
+VALID_CAREERS = frozenset(EXPECTED_ROLES)
+
+# Response schemas; decoding raises msgspec.ValidationError on a missing field or wrong type
+class User(msgspec.Struct):
+    id: str
+    name: str
+    email: str
+    points: int
+    level: int
+    badges: List[str]
+    created_at: str
+
+class Quiz(msgspec.Struct):
+    id: str
+    question: str
+    option_a: str
+    option_b: str
+    option_c: str
+    option_d: str
+    correct_option: str
+    category: str
+
+class Recommendation(msgspec.Struct):
+    recommended_career: str
+    roadmap_url: str
+    score_breakdown: Dict[str, Any]
+    confidence: float
+
+class SubmitResult(msgspec.Struct):
+    points_earned: int
+    total_points: int
+    level: int
+    badges: List[str]
+    category_scores: Dict[str, float]
+    recommendation: Recommendation
+
+class AddPointsResult(msgspec.Struct):
+    points_added: int
+    total_points: int
+    level: int
+    badges: List[str]
+
+class Roadmap(msgspec.Struct):
+    id: str
+    skill_role: str
+    roadmap_url: str
+    description: str
+
+def requires(test_name: str, *attrs: str):
+    """Fail a dependent test up front when tester attributes set by earlier tests are still empty"""
+    def decorator(test_func):
+        @functools.wraps(test_func)
+        async def wrapper(self, *args, **kwargs):
+            missing = [attr for attr in attrs if not getattr(self, attr, None)]
+            if missing:
+                self.log_result(test_name, False, f"Missing prerequisites: {', '.join(missing)}")
+                return False
+            return await test_func(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+@dataclass(slots=True)
+class TestResults:
+    """Pass/fail tally for a suite run"""
+    __test__ = False  # not a pytest test class despite the name
+    
+    passed: int = 0
+    failed: int = 0
+    errors: Deque[Tuple[str, str]] = field(default_factory=collections.deque)
 
 class CareerAdvisorAPITester:
     def __init__(self):
         self.base_url = BACKEND_URL
+        self.client = None
         self.test_user_id = None
-        self.quiz_questions = []
-        self.test_results = {
-            "passed": 0,
-            "failed": 0,
-            "errors": []
-        }
+        self._quiz_index = []
+        self._submission_templates: Dict[frozenset, bytes] = {}
+        self._cache: Dict[str, Any] = {}
+        self.test_results = TestResults()
+    
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            headers={"Content-Type": "application/json"},
+            timeout=15.0,
+            limits=httpx.Limits(max_keepalive_connections=4, max_connections=8)
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.client.aclose()
+    
+    async def _request(self, method: str, path: str, **kwargs):
+        """Send a request over the shared client, retrying idempotent methods on transport and gateway errors"""
+        attempts = RETRY_TOTAL + 1 if method in RETRY_METHODS else 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = await self.client.request(method, path, **kwargs)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code not in RETRY_STATUSES or last_attempt:
+                    return response
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+    
+    async def _post_json(self, path: str, obj: Any, **kwargs):
+        """POST a JSON body encoded with orjson"""
+        return await self._request("POST", path, content=orjson.dumps(obj), **kwargs)
+    
+    async def _cached_get(self, path: str, **kwargs):
+        """GET immutable reference data, reusing the first successful response for the suite lifetime"""
+        if path not in self._cache:
+            response = await self._request("GET", path, **kwargs)
+            if response.status_code != 200:
+                return response
+            self._cache[path] = response
+        return self._cache[path]
+    
+    def _answers_for(self, targets: frozenset) -> List[Dict[str, str]]:
+        """Answer the quizzes in the target categories correctly and everything else with option 'a'"""
+        return [
+            {"quiz_id": quiz_id, "selected_option": correct if category in targets else "a"}
+            for quiz_id, category, correct in self._quiz_index
+        ]
+    
+    def _submission_body(self, targets: frozenset, user_id: str) -> bytes:
+        """Serialized submit-quiz body; answers are encoded once per target set and only the user ID is spliced in"""
+        template = self._submission_templates.get(targets)
+        if template is None:
+            template = orjson.dumps({"user_id": "__UID__", "answers": self._answers_for(targets)})
+            self._submission_templates[targets] = template
+        return template.replace(_UID_PLACEHOLDER, orjson.dumps(user_id))
     
     def log_result(self, test_name: str, success: bool, message: str = ""):
         """Log test results"""
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name}")
-        if message:
-            print(f"   Details: {message}")
+        sys.stdout.write(f"{status}: {test_name}\n" + (f"   Details: {message}\n" if message else "") + "\n")
         
         if success:
-            self.test_results["passed"] += 1
+            self.test_results.passed += 1
         else:
-            self.test_results["failed"] += 1
-            self.test_results["errors"].append(f"{test_name}: {message}")
-        print()
+            self.test_results.failed += 1
+            self.test_results.errors.append((test_name, message))
     
-    def test_api_health(self):
+    async def test_api_health(self):
         """Test basic API connectivity"""
         try:
-            response = requests.get(f"{self.base_url}/", timeout=10)
+            response = await self._request("GET", "/", timeout=10)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.log_result("API Health Check", True, f"API is responding: {data.get('message', 'OK')}")
                 return True
             else:
@@ -50,12 +193,12 @@ class CareerAdvisorAPITester:
             self.log_result("API Health Check", False, f"Connection error: {str(e)}")
             return False
     
-    def test_init_data(self):
+    async def test_init_data(self):
         """Test POST /api/init-data - Initialize sample data"""
         try:
-            response = requests.post(f"{self.base_url}/init-data", timeout=15)
+            response = await self._request("POST", "/init-data", timeout=15)
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 self.log_result("Initialize Data", True, data.get("message", "Data initialized"))
                 return True
             else:
@@ -65,7 +208,7 @@ class CareerAdvisorAPITester:
             self.log_result("Initialize Data", False, f"Error: {str(e)}")
             return False
     
-    def test_create_user(self):
+    async def test_create_user(self):
         """Test POST /api/users - Create new user"""
         try:
             user_data = {
@@ -73,26 +216,18 @@ class CareerAdvisorAPITester:
                 "email": "sarah.johnson@example.com"
             }
             
-            response = requests.post(
-                f"{self.base_url}/users",
-                json=user_data,
-                headers={"Content-Type": "application/json"},
+            response = await self._post_json(
+                "/users", user_data,
                 timeout=10
             )
             
             if response.status_code == 200:
-                user = response.json()
-                self.test_user_id = user["id"]
-                required_fields = ["id", "name", "email", "points", "level", "badges", "created_at"]
-                missing_fields = [field for field in required_fields if field not in user]
-                
-                if missing_fields:
-                    self.log_result("Create User", False, f"Missing fields: {missing_fields}")
-                    return False
+                user = msgspec.json.decode(response.content, type=User)
+                self.test_user_id = user.id
                 
                 # Validate initial values
-                if user["points"] != 0 or user["level"] != 1 or user["badges"] != []:
-                    self.log_result("Create User", False, f"Invalid initial values: points={user['points']}, level={user['level']}, badges={user['badges']}")
+                if user.points != 0 or user.level != 1 or user.badges != []:
+                    self.log_result("Create User", False, f"Invalid initial values: points={user.points}, level={user.level}, badges={user.badges}")
                     return False
                 
                 self.log_result("Create User", True, f"User created with ID: {self.test_user_id}")
@@ -104,28 +239,25 @@ class CareerAdvisorAPITester:
             self.log_result("Create User", False, f"Error: {str(e)}")
             return False
     
-    def test_get_user(self):
+    @requires("Get User", "test_user_id")
+    async def test_get_user(self):
         """Test GET /api/users/{user_id} - Fetch user data"""
-        if not self.test_user_id:
-            self.log_result("Get User", False, "No test user ID available")
-            return False
-        
         try:
-            response = requests.get(f"{self.base_url}/users/{self.test_user_id}", timeout=10)
+            response = await self._request("GET", f"/users/{self.test_user_id}", timeout=10)
             
             if response.status_code == 200:
-                user = response.json()
+                user = msgspec.json.decode(response.content, type=User)
                 
                 # Validate user data
-                if user["id"] != self.test_user_id:
-                    self.log_result("Get User", False, f"User ID mismatch: expected {self.test_user_id}, got {user['id']}")
+                if user.id != self.test_user_id:
+                    self.log_result("Get User", False, f"User ID mismatch: expected {self.test_user_id}, got {user.id}")
                     return False
                 
-                if user["name"] != "Sarah Johnson":
-                    self.log_result("Get User", False, f"Name mismatch: expected 'Sarah Johnson', got '{user['name']}'")
+                if user.name != "Sarah Johnson":
+                    self.log_result("Get User", False, f"Name mismatch: expected 'Sarah Johnson', got '{user.name}'")
                     return False
                 
-                self.log_result("Get User", True, f"User retrieved successfully: {user['name']} (Level {user['level']}, {user['points']} points)")
+                self.log_result("Get User", True, f"User retrieved successfully: {user.name} (Level {user.level}, {user.points} points)")
                 return True
             else:
                 self.log_result("Get User", False, f"Status: {response.status_code}, Response: {response.text}")
@@ -134,40 +266,25 @@ class CareerAdvisorAPITester:
             self.log_result("Get User", False, f"Error: {str(e)}")
             return False
     
-    def test_get_quizzes(self):
+    async def test_get_quizzes(self):
         """Test GET /api/quizzes - Fetch all quiz questions"""
         try:
-            response = requests.get(f"{self.base_url}/quizzes", timeout=10)
+            response = await self._cached_get("/quizzes", timeout=10)
             
             if response.status_code == 200:
-                quizzes = response.json()
-                self.quiz_questions = quizzes
-                
-                # Validate quiz structure
-                if not isinstance(quizzes, list):
-                    self.log_result("Get Quizzes", False, "Response is not a list")
-                    return False
+                quizzes = msgspec.json.decode(response.content, type=List[Quiz])
                 
                 if len(quizzes) != 10:
                     self.log_result("Get Quizzes", False, f"Expected 10 questions, got {len(quizzes)}")
                     return False
                 
-                # Validate quiz question structure
-                required_fields = ["id", "question", "option_a", "option_b", "option_c", "option_d", "correct_option", "category"]
-                for i, quiz in enumerate(quizzes):
-                    missing_fields = [field for field in required_fields if field not in quiz]
-                    if missing_fields:
-                        self.log_result("Get Quizzes", False, f"Question {i+1} missing fields: {missing_fields}")
-                        return False
-                
                 # Check categories distribution
-                categories = [q["category"] for q in quizzes]
-                expected_categories = ["problem_solving", "creativity", "leadership", "analytics", "communication"]
-                for cat in expected_categories:
-                    if cat not in categories:
-                        self.log_result("Get Quizzes", False, f"Missing category: {cat}")
-                        return False
+                categories = {q.category for q in quizzes}
+                if not EXPECTED_CATEGORIES <= categories:
+                    self.log_result("Get Quizzes", False, f"Missing categories: {sorted(EXPECTED_CATEGORIES - categories)}")
+                    return False
                 
+                self._quiz_index = [(q.id, q.category, q.correct_option) for q in quizzes]
                 self.log_result("Get Quizzes", True, f"Retrieved {len(quizzes)} quiz questions with all required categories")
                 return True
             else:
@@ -177,85 +294,44 @@ class CareerAdvisorAPITester:
             self.log_result("Get Quizzes", False, f"Error: {str(e)}")
             return False
     
-    def test_submit_quiz(self):
+    @requires("Submit Quiz", "test_user_id", "_quiz_index")
+    async def test_submit_quiz(self):
         """Test POST /api/submit-quiz - Submit quiz answers and get career recommendation"""
-        if not self.test_user_id or not self.quiz_questions:
-            self.log_result("Submit Quiz", False, "Missing test user ID or quiz questions")
-            return False
-        
         try:
             # Create realistic quiz answers that should lead to Web Developer recommendation
             # High problem-solving + creativity scores
-            answers = []
-            for quiz in self.quiz_questions:
-                if quiz["category"] in ["problem_solving", "creativity"]:
-                    # Answer correctly for these categories
-                    selected_option = quiz["correct_option"]
-                else:
-                    # Answer with option 'a' for others
-                    selected_option = "a"
-                
-                answers.append({
-                    "quiz_id": quiz["id"],
-                    "selected_option": selected_option
-                })
+            targets = STRATEGY_TARGETS["problem_solving_creativity"]
             
-            submission_data = {
-                "user_id": self.test_user_id,
-                "answers": answers
-            }
-            
-            response = requests.post(
-                f"{self.base_url}/submit-quiz",
-                json=submission_data,
-                headers={"Content-Type": "application/json"},
+            response = await self._request(
+                "POST", "/submit-quiz",
+                content=self._submission_body(targets, self.test_user_id),
                 timeout=15
             )
             
             if response.status_code == 200:
-                result = response.json()
-                
-                # Validate response structure
-                required_fields = ["points_earned", "total_points", "level", "badges", "category_scores", "recommendation"]
-                missing_fields = [field for field in required_fields if field not in result]
-                
-                if missing_fields:
-                    self.log_result("Submit Quiz", False, f"Missing fields in response: {missing_fields}")
-                    return False
+                result = msgspec.json.decode(response.content, type=SubmitResult)
                 
                 # Validate points calculation
-                if result["points_earned"] <= 0:
-                    self.log_result("Submit Quiz", False, f"No points earned: {result['points_earned']}")
+                if result.points_earned <= 0:
+                    self.log_result("Submit Quiz", False, f"No points earned: {result.points_earned}")
                     return False
                 
                 # Validate category scores
-                category_scores = result["category_scores"]
-                expected_categories = ["problem_solving", "creativity", "leadership", "analytics", "communication"]
-                for cat in expected_categories:
-                    if cat not in category_scores:
-                        self.log_result("Submit Quiz", False, f"Missing category score: {cat}")
-                        return False
-                
-                # Validate recommendation structure
-                recommendation = result["recommendation"]
-                rec_fields = ["recommended_career", "roadmap_url", "score_breakdown", "confidence"]
-                missing_rec_fields = [field for field in rec_fields if field not in recommendation]
-                
-                if missing_rec_fields:
-                    self.log_result("Submit Quiz", False, f"Missing recommendation fields: {missing_rec_fields}")
+                missing_scores = EXPECTED_CATEGORIES - result.category_scores.keys()
+                if missing_scores:
+                    self.log_result("Submit Quiz", False, f"Missing category scores: {sorted(missing_scores)}")
                     return False
                 
                 # Test career recommendation logic
-                career = recommendation["recommended_career"]
-                expected_careers = ["Web Developer", "Flutter Developer", "Data Scientist", "Cybersecurity Specialist", "Entrepreneur"]
-                
-                if career not in expected_careers:
+                recommendation = result.recommendation
+                career = recommendation.recommended_career
+                if career not in VALID_CAREERS:
                     self.log_result("Submit Quiz", False, f"Invalid career recommendation: {career}")
                     return False
                 
                 self.log_result("Submit Quiz", True, 
-                    f"Quiz submitted successfully. Points: {result['points_earned']}, Level: {result['level']}, "
-                    f"Career: {career}, Confidence: {recommendation['confidence']:.2f}")
+                    f"Quiz submitted successfully. Points: {result.points_earned}, Level: {result.level}, "
+                    f"Career: {career}, Confidence: {recommendation.confidence:.2f}")
                 return True
             else:
                 self.log_result("Submit Quiz", False, f"Status: {response.status_code}, Response: {response.text}")
@@ -264,43 +340,33 @@ class CareerAdvisorAPITester:
             self.log_result("Submit Quiz", False, f"Error: {str(e)}")
             return False
     
-    def test_add_points(self):
+    @requires("Add Points", "test_user_id")
+    async def test_add_points(self):
         """Test POST /api/users/{user_id}/add-points - Add exploration points"""
-        if not self.test_user_id:
-            self.log_result("Add Points", False, "No test user ID available")
-            return False
-        
         try:
             # Add 50 exploration points
-            response = requests.post(
-                f"{self.base_url}/users/{self.test_user_id}/add-points?points=50",
+            response = await self._request(
+                "POST", f"/users/{self.test_user_id}/add-points",
+                params={"points": 50},
                 timeout=10
             )
             
             if response.status_code == 200:
-                result = response.json()
-                
-                # Validate response structure
-                required_fields = ["points_added", "total_points", "level", "badges"]
-                missing_fields = [field for field in required_fields if field not in result]
-                
-                if missing_fields:
-                    self.log_result("Add Points", False, f"Missing fields: {missing_fields}")
-                    return False
+                result = msgspec.json.decode(response.content, type=AddPointsResult)
                 
                 # Validate points addition
-                if result["points_added"] != 50:
-                    self.log_result("Add Points", False, f"Expected 50 points added, got {result['points_added']}")
+                if result.points_added != 50:
+                    self.log_result("Add Points", False, f"Expected 50 points added, got {result.points_added}")
                     return False
                 
                 # Check if badges were awarded (should get "Quiz Master" badge at 50+ points)
-                if result["total_points"] >= 50 and "Quiz Master" not in result["badges"]:
-                    self.log_result("Add Points", False, f"Expected 'Quiz Master' badge at {result['total_points']} points")
+                if result.total_points >= 50 and "Quiz Master" not in result.badges:
+                    self.log_result("Add Points", False, f"Expected 'Quiz Master' badge at {result.total_points} points")
                     return False
                 
                 self.log_result("Add Points", True, 
-                    f"Added {result['points_added']} points. Total: {result['total_points']}, "
-                    f"Level: {result['level']}, Badges: {result['badges']}")
+                    f"Added {result.points_added} points. Total: {result.total_points}, "
+                    f"Level: {result.level}, Badges: {result.badges}")
                 return True
             else:
                 self.log_result("Add Points", False, f"Status: {response.status_code}, Response: {response.text}")
@@ -309,45 +375,32 @@ class CareerAdvisorAPITester:
             self.log_result("Add Points", False, f"Error: {str(e)}")
             return False
     
-    def test_get_roadmaps(self):
+    async def test_get_roadmaps(self):
         """Test GET /api/roadmaps - Fetch all career roadmaps"""
         try:
-            response = requests.get(f"{self.base_url}/roadmaps", timeout=10)
+            response = await self._cached_get("/roadmaps", timeout=10)
             
             if response.status_code == 200:
-                roadmaps = response.json()
-                
-                # Validate roadmaps structure
-                if not isinstance(roadmaps, list):
-                    self.log_result("Get Roadmaps", False, "Response is not a list")
-                    return False
+                roadmaps = msgspec.json.decode(response.content, type=List[Roadmap])
                 
                 if len(roadmaps) != 5:
                     self.log_result("Get Roadmaps", False, f"Expected 5 roadmaps, got {len(roadmaps)}")
                     return False
                 
                 # Validate roadmap structure
-                required_fields = ["id", "skill_role", "roadmap_url", "description"]
-                expected_roles = ["Web Developer", "Flutter Developer", "Data Scientist", "Cybersecurity Specialist", "Entrepreneur"]
-                
-                found_roles = []
+                found_roles = set()
                 for roadmap in roadmaps:
-                    missing_fields = [field for field in required_fields if field not in roadmap]
-                    if missing_fields:
-                        self.log_result("Get Roadmaps", False, f"Roadmap missing fields: {missing_fields}")
-                        return False
-                    
-                    found_roles.append(roadmap["skill_role"])
+                    found_roles.add(roadmap.skill_role)
                     
                     # Validate URL format
-                    if not roadmap["roadmap_url"].startswith("https://roadmap.sh/"):
-                        self.log_result("Get Roadmaps", False, f"Invalid roadmap URL: {roadmap['roadmap_url']}")
+                    if not roadmap.roadmap_url.startswith("https://roadmap.sh/"):
+                        self.log_result("Get Roadmaps", False, f"Invalid roadmap URL: {roadmap.roadmap_url}")
                         return False
                 
                 # Check if all expected roles are present
-                missing_roles = [role for role in expected_roles if role not in found_roles]
+                missing_roles = VALID_CAREERS - found_roles
                 if missing_roles:
-                    self.log_result("Get Roadmaps", False, f"Missing career roles: {missing_roles}")
+                    self.log_result("Get Roadmaps", False, f"Missing career roles: {sorted(missing_roles)}")
                     return False
                 
                 self.log_result("Get Roadmaps", True, f"Retrieved {len(roadmaps)} roadmaps for all career paths")
@@ -359,34 +412,26 @@ class CareerAdvisorAPITester:
             self.log_result("Get Roadmaps", False, f"Error: {str(e)}")
             return False
     
-    def test_get_specific_roadmap(self):
+    async def test_get_specific_roadmap(self):
         """Test GET /api/roadmaps/{career} - Fetch specific career roadmap"""
         try:
             career = "Web Developer"
-            response = requests.get(f"{self.base_url}/roadmaps/{career}", timeout=10)
+            response = await self._cached_get(f"/roadmaps/{career}", timeout=10)
             
             if response.status_code == 200:
-                roadmap = response.json()
-                
-                # Validate roadmap structure
-                required_fields = ["id", "skill_role", "roadmap_url", "description"]
-                missing_fields = [field for field in required_fields if field not in roadmap]
-                
-                if missing_fields:
-                    self.log_result("Get Specific Roadmap", False, f"Missing fields: {missing_fields}")
-                    return False
+                roadmap = msgspec.json.decode(response.content, type=Roadmap)
                 
                 # Validate career match
-                if roadmap["skill_role"] != career:
-                    self.log_result("Get Specific Roadmap", False, f"Career mismatch: expected '{career}', got '{roadmap['skill_role']}'")
+                if roadmap.skill_role != career:
+                    self.log_result("Get Specific Roadmap", False, f"Career mismatch: expected '{career}', got '{roadmap.skill_role}'")
                     return False
                 
                 # Validate URL
-                if not roadmap["roadmap_url"].startswith("https://roadmap.sh/"):
-                    self.log_result("Get Specific Roadmap", False, f"Invalid roadmap URL: {roadmap['roadmap_url']}")
+                if not roadmap.roadmap_url.startswith("https://roadmap.sh/"):
+                    self.log_result("Get Specific Roadmap", False, f"Invalid roadmap URL: {roadmap.roadmap_url}")
                     return False
                 
-                self.log_result("Get Specific Roadmap", True, f"Retrieved roadmap for {career}: {roadmap['roadmap_url']}")
+                self.log_result("Get Specific Roadmap", True, f"Retrieved roadmap for {career}: {roadmap.roadmap_url}")
                 return True
             else:
                 self.log_result("Get Specific Roadmap", False, f"Status: {response.status_code}, Response: {response.text}")
@@ -395,12 +440,9 @@ class CareerAdvisorAPITester:
             self.log_result("Get Specific Roadmap", False, f"Error: {str(e)}")
             return False
     
-    def test_career_recommendation_logic(self):
+    @requires("Career Recommendation Logic", "test_user_id", "_quiz_index")
+    async def test_career_recommendation_logic(self):
         """Test different career recommendation scenarios"""
-        if not self.test_user_id or not self.quiz_questions:
-            self.log_result("Career Recommendation Logic", False, "Missing prerequisites")
-            return False
-        
         test_scenarios = [
             {
                 "name": "Data Scientist Path",
@@ -414,92 +456,66 @@ class CareerAdvisorAPITester:
             }
         ]
         
-        all_passed = True
-        
-        for scenario in test_scenarios:
-            try:
-                # Create a new test user for this scenario
-                user_data = {
-                    "name": f"Test User {scenario['name']}",
-                    "email": f"test.{uuid.uuid4().hex[:8]}@example.com"
-                }
-                
-                user_response = requests.post(
-                    f"{self.base_url}/users",
-                    json=user_data,
-                    headers={"Content-Type": "application/json"},
-                    timeout=10
-                )
-                
-                if user_response.status_code != 200:
-                    self.log_result(f"Career Logic - {scenario['name']}", False, "Failed to create test user")
-                    all_passed = False
-                    continue
-                
-                test_user = user_response.json()
-                
-                # Create targeted answers based on strategy
-                answers = []
-                for quiz in self.quiz_questions:
-                    if scenario["strategy"] == "analytics_high":
-                        # Target analytics and problem_solving
-                        if quiz["category"] in ["analytics", "problem_solving"]:
-                            selected_option = quiz["correct_option"]
-                        else:
-                            selected_option = "a"
-                    elif scenario["strategy"] == "leadership_communication":
-                        # Target leadership and communication
-                        if quiz["category"] in ["leadership", "communication"]:
-                            selected_option = quiz["correct_option"]
-                        else:
-                            selected_option = "a"
-                    else:
-                        selected_option = "a"
-                    
-                    answers.append({
-                        "quiz_id": quiz["id"],
-                        "selected_option": selected_option
-                    })
-                
-                submission_data = {
-                    "user_id": test_user["id"],
-                    "answers": answers
-                }
-                
-                response = requests.post(
-                    f"{self.base_url}/submit-quiz",
-                    json=submission_data,
-                    headers={"Content-Type": "application/json"},
-                    timeout=15
-                )
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    recommended_career = result["recommendation"]["recommended_career"]
-                    
-                    # Note: The recommendation logic might not always match exactly due to scoring complexity
-                    # We'll consider it a pass if we get a valid career recommendation
-                    valid_careers = ["Web Developer", "Flutter Developer", "Data Scientist", "Cybersecurity Specialist", "Entrepreneur"]
-                    
-                    if recommended_career in valid_careers:
-                        self.log_result(f"Career Logic - {scenario['name']}", True, 
-                            f"Got valid recommendation: {recommended_career} (target was {scenario['expected_career']})")
-                    else:
-                        self.log_result(f"Career Logic - {scenario['name']}", False, 
-                            f"Invalid career recommendation: {recommended_career}")
-                        all_passed = False
+        results = await asyncio.gather(*(self._run_scenario(scenario) for scenario in test_scenarios))
+        return all(results)
+    
+    async def _run_scenario(self, scenario: Dict[str, str]) -> bool:
+        """Create a fresh user, submit strategy-targeted answers and validate the recommendation"""
+        try:
+            # Create a new test user for this scenario
+            user_data = {
+                "name": f"Test User {scenario['name']}",
+                "email": f"test.{_RNG.getrandbits(32):08x}@example.com"
+            }
+            
+            user_response = await self._post_json(
+                "/users", user_data,
+                timeout=10
+            )
+            
+            if user_response.status_code != 200:
+                self.log_result(f"Career Logic - {scenario['name']}", False, "Failed to create test user")
+                return False
+            
+            test_user = msgspec.json.decode(user_response.content, type=User)
+            
+            # Create targeted answers based on strategy
+            targets = STRATEGY_TARGETS.get(scenario["strategy"], STRATEGY_TARGETS["default"])
+            
+            response = await self._request(
+                "POST", "/submit-quiz",
+                content=self._submission_body(targets, test_user.id),
+                timeout=15
+            )
+            
+            if response.status_code == 200:
+                result = msgspec.json.decode(response.content, type=SubmitResult)
+                recommended_career = result.recommendation.recommended_career
+                
+                # Note: The recommendation logic might not always match exactly due to scoring complexity
+                # We'll consider it a pass if we get a valid career recommendation
+                if recommended_career in VALID_CAREERS:
+                    self.log_result(f"Career Logic - {scenario['name']}", True, 
+                        f"Got valid recommendation: {recommended_career} (target was {scenario['expected_career']})")
+                    return True
                 else:
                     self.log_result(f"Career Logic - {scenario['name']}", False, 
-                        f"Quiz submission failed: {response.status_code}")
-                    all_passed = False
-                    
-            except Exception as e:
-                self.log_result(f"Career Logic - {scenario['name']}", False, f"Error: {str(e)}")
-                all_passed = False
-        
-        return all_passed
+                        f"Invalid career recommendation: {recommended_career}")
+                    return False
+            else:
+                self.log_result(f"Career Logic - {scenario['name']}", False, 
+                    f"Quiz submission failed: {response.status_code}")
+                return False
+        except Exception as e:
+            self.log_result(f"Career Logic - {scenario['name']}", False, f"Error: {str(e)}")
+            return False
     
-    def run_all_tests(self):
+    async def _run_quiz_flow(self):
+        """Submit the quiz, then add points on top of the resulting total"""
+        await self.test_submit_quiz()
+        return await self.test_add_points()
+    
+    async def run_all_tests(self):
         """Run all backend API tests"""
         print("=" * 80)
         print("🚀 STARTING COMPREHENSIVE BACKEND API TESTING")
@@ -507,45 +523,60 @@ class CareerAdvisorAPITester:
         print(f"Backend URL: {self.base_url}")
         print()
         
-        # Test sequence
-        tests = [
-            ("API Health Check", self.test_api_health),
-            ("Initialize Sample Data", self.test_init_data),
-            ("Create User", self.test_create_user),
-            ("Get User", self.test_get_user),
-            ("Get Quiz Questions", self.test_get_quizzes),
-            ("Submit Quiz & Get Recommendation", self.test_submit_quiz),
-            ("Add Exploration Points", self.test_add_points),
-            ("Get All Roadmaps", self.test_get_roadmaps),
-            ("Get Specific Roadmap", self.test_get_specific_roadmap),
-            ("Career Recommendation Logic", self.test_career_recommendation_logic)
+        # Test stages: tests within a stage are independent and run concurrently,
+        # each stage only depends on the data set up by the previous ones
+        stages = [
+            ("Setup", [
+                ("API Health Check", self.test_api_health),
+                ("Initialize Sample Data", self.test_init_data),
+            ]),
+            ("Users & Reference Data", [
+                ("Create User", self.test_create_user),
+                ("Get Quiz Questions", self.test_get_quizzes),
+                ("Get All Roadmaps", self.test_get_roadmaps),
+                ("Get Specific Roadmap", self.test_get_specific_roadmap),
+            ]),
+            ("Dependent Tests", [
+                ("Get User", self.test_get_user),
+                ("Submit Quiz & Add Exploration Points", self._run_quiz_flow),
+                ("Career Recommendation Logic", self.test_career_recommendation_logic),
+            ]),
         ]
         
-        for test_name, test_func in tests:
-            print(f"🧪 Running: {test_name}")
-            test_func()
-            time.sleep(1)  # Brief pause between tests
+        for stage_name, tests in stages:
+            print(f"🧪 Running {stage_name}: {', '.join(test_name for test_name, _ in tests)}")
+            await asyncio.gather(*(test_func() for _, test_func in tests))
         
         # Final results
         print("=" * 80)
         print("📊 FINAL TEST RESULTS")
         print("=" * 80)
-        print(f"✅ Passed: {self.test_results['passed']}")
-        print(f"❌ Failed: {self.test_results['failed']}")
-        print(f"📈 Success Rate: {(self.test_results['passed'] / (self.test_results['passed'] + self.test_results['failed']) * 100):.1f}%")
+        print(f"✅ Passed: {self.test_results.passed}")
+        print(f"❌ Failed: {self.test_results.failed}")
+        print(f"📈 Success Rate: {(self.test_results.passed / (self.test_results.passed + self.test_results.failed) * 100):.1f}%")
         
-        if self.test_results["errors"]:
+        if self.test_results.errors:
             print("\n🚨 FAILED TESTS:")
-            for error in self.test_results["errors"]:
-                print(f"   • {error}")
+            for test_name, message in self.test_results.errors:
+                print(f"   • {test_name}: {message}")
         
         print("\n" + "=" * 80)
+        sys.stdout.flush()
         
-        return self.test_results["failed"] == 0
+        return self.test_results.failed == 0
+
+async def main():
+    async with CareerAdvisorAPITester() as tester:
+        return await tester.run_all_tests()
 
 if __name__ == "__main__":
-    tester = CareerAdvisorAPITester()
-    success = tester.run_all_tests()
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    success = asyncio.run(main())
     
     if success:
         print("🎉 ALL TESTS PASSED! Backend API is working correctly.")